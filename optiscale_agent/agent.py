@@ -4,9 +4,26 @@ Main ADK agent definition for OptiScale_AI_LLM.
 """
 
 from google.adk.agents.llm_agent import Agent
+from google.adk.tools import FunctionTool
 
 from .config import MODEL_ID
-from . import tools
+from . import cache, tools
+
+
+# Wrap the tool functions once at import. ADK re-wraps bare callables in a new
+# FunctionTool (re-inspecting signature and docstring) on every invocation;
+# prebuilt tool instances are reused as-is.
+_TOOLS = tuple(
+    FunctionTool(func)
+    for func in (
+        tools.load_and_profile_costs_async,
+        tools.estimate_savings_from_actions,
+        tools.estimate_savings_batch,
+        tools.compare_two_cost_scenarios,
+        tools.compare_cost_scenarios,
+        tools.generate_exec_summary_outline,
+    )
+)
 
 
 root_agent = Agent(
@@ -30,9 +47,12 @@ Your primary responsibilities:
 
 4. When you propose an optimization plan:
    - For high-level scenarios, use `estimate_savings_from_actions` to compute rough
-     savings (monthly and annual).
+     savings (monthly and annual). To evaluate several reduction assumptions at once
+     (e.g. conservative / expected / aggressive), call `estimate_savings_batch` once
+     instead of repeating the single-scenario tool.
    - When comparing different options, use `compare_two_cost_scenarios` to show clear
-     deltas and percentage savings.
+     deltas and percentage savings. For more than two options, use
+     `compare_cost_scenarios` with all scenario costs in one call.
    - Always state assumptions and call out that numbers are estimates.
 
 5. When the user asks for stakeholder communication material:
@@ -49,10 +69,7 @@ Tone & style:
 
 Never expose internal implementation details (like Python stack traces) to the user.
 """,
-    tools=[
-        tools.load_and_profile_costs,
-        tools.estimate_savings_from_actions,
-        tools.compare_two_cost_scenarios,
-        tools.generate_exec_summary_outline,
-    ],
+    tools=list(_TOOLS),
+    before_tool_callback=cache.before_tool_callback,
+    after_tool_callback=cache.after_tool_callback,
 )
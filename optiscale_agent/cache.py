@@ -0,0 +1,132 @@
+"""
+Session-scoped memoization for the OptiScale agent.
+
+Within one ADK session, users often repeat a question or re-send the same
+billing export while refining a request. The tool callbacks below, registered
+on `root_agent`, serve such repeats from a shared LRU instead of re-running
+the tool. Results are keyed by (app name, user id, session id, tool name,
+arguments), so sessions of different users never share entries even when
+they reuse the same session id.
+
+Model responses are not cached: a reply depends on the whole conversation,
+not just the latest message, so the model is asked on every turn.
+
+The digest of the CSV last profiled in a session is kept in session state.
+Profiling a different CSV flushes the session's older entries, which were
+computed against the previous data.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
+
+from .config import SESSION_CACHE_SIZE
+
+
+class SessionCache:
+    """Thread-safe, size-bounded LRU whose keys start with a session scope."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        """Return the cached value for ``key`` (or None), marking it recent."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recent entries."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_session(self, scope: Hashable) -> None:
+        """Drop every entry whose key starts with ``scope``."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == scope]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+session_cache = SessionCache(SESSION_CACHE_SIZE)
+
+# Session state key holding the digest of the CSV last profiled in the session.
+CSV_DIGEST_STATE_KEY = "optiscale_csv_digest"
+
+
+def _digest(payload: Any) -> str:
+    """Stable BLAKE2 digest of a JSON-serializable payload."""
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _csv_digest(csv_text: str) -> str:
+    """BLAKE2 digest of the raw CSV text, skipping the JSON round-trip."""
+    return hashlib.blake2b(csv_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _session_scope(tool_context: ToolContext) -> Tuple[str, str, str]:
+    session = tool_context.session
+    return (session.app_name, session.user_id, session.id)
+
+
+def _tool_key(
+    tool: BaseTool, args: Dict[str, Any], tool_context: ToolContext
+) -> Tuple[Hashable, ...]:
+    if "csv_text" in args:
+        # The CSV was already hashed once into session state; reuse that digest
+        # instead of serializing and hashing the whole export again.
+        args = {**args, "csv_text": tool_context.state.get(CSV_DIGEST_STATE_KEY)}
+    return (_session_scope(tool_context), "tool", tool.name, _digest(args))
+
+
+def before_tool_callback(
+    tool: BaseTool, args: Dict[str, Any], tool_context: ToolContext
+) -> Optional[Dict[str, Any]]:
+    """Serve a repeated tool call from the session cache."""
+    if "csv_text" in args:
+        csv_digest = _csv_digest(str(args["csv_text"]))
+        previous = tool_context.state.get(CSV_DIGEST_STATE_KEY)
+        if previous != csv_digest:
+            if previous is not None:
+                session_cache.invalidate_session(_session_scope(tool_context))
+            tool_context.state[CSV_DIGEST_STATE_KEY] = csv_digest
+
+    cached = session_cache.get(_tool_key(tool, args, tool_context))
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def after_tool_callback(
+    tool: BaseTool,
+    args: Dict[str, Any],
+    tool_context: ToolContext,
+    tool_response: Dict[str, Any],
+) -> None:
+    """Remember a tool result for the rest of the session."""
+    if isinstance(tool_response, dict):
+        session_cache.put(
+            _tool_key(tool, args, tool_context), copy.deepcopy(tool_response)
+        )
+    return None
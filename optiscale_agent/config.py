@@ -6,6 +6,13 @@ Configuration for the OptiScale AI LLM agent.
 # You can change this later if needed.
 MODEL_ID: str = "gemini-2.0-flash"
 
+# Largest CSV payload (in characters) that load_and_profile_costs will parse.
+# Bigger exports should be pre-aggregated before being handed to the agent.
+MAX_CSV_CHARS: int = 100_000_000
+
+# Tool results memoized across all sessions (see cache.py).
+SESSION_CACHE_SIZE: int = 512
+
 # Application metadata (for tests / runners)
 APP_NAME: str = "optiscale_ai_llm"
 DEFAULT_USER_ID: str = "optiscale-user"
@@ -1,11 +1,186 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import concurrent.futures
+import csv
+import functools
+import hashlib
 import io
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
+from .config import MAX_CSV_CHARS
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is an optional accelerator; fall back to pandas.
+    pa = pc = pacsv = None
+
+try:
+    import numba
+except ImportError:  # numba is optional; group sums fall back to np.bincount.
+    numba = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; batch tools fall back to numpy.
+    ne = None
+
+# Number of entries kept in the per-service / per-project breakdowns.
+TOP_N_GROUPS = 20
+
+# Arrow CSV reader block size; each block is tokenized on its own thread.
+_ARROW_BLOCK_SIZE = 1 << 20
+
+# pd.read_csv's default NA strings; the Arrow reader is given the same set so
+# both backends treat the same cells as missing.
+_PANDAS_NA_VALUES = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+)
+
+# Below this many rows the parallel numba kernel's thread start-up costs more
+# than np.bincount spends summing.
+_NUMBA_MIN_ROWS = 100_000
+
+# Batch tool inputs at least this long are evaluated with NumExpr, which fuses
+# the arithmetic into one multi-threaded pass; shorter ones stay on numpy.
+_NUMEXPR_MIN_SIZE = 10_000
+
+# Number of distinct CSV payloads whose profiles are memoized. Users tend to
+# re-submit the same billing export while iterating on their questions.
+PROFILE_CACHE_SIZE = 64
+
+# Number of argument combinations memoized for each of the pure tools below.
+_TOOL_CACHE_SIZE = 256
+
+_EXEC_SUMMARY_TITLE = "Cloud Cost Optimization – Executive Summary"
+
+# Placeholder replaced with the caller's goal in the outline bullets below.
+_GOAL_SENTINEL = "{goal}"
+
+# (heading, bullets) for every executive summary section, built once at import.
+_STATIC_SECTIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "1. Context & Objectives",
+        (
+            "Briefly describe current cloud cost baseline and growth trend.",
+            f"State the primary goal: {_GOAL_SENTINEL}",
+            "Clarify time horizon and acceptable risk/constraints.",
+        ),
+    ),
+    (
+        "2. Key Cost Drivers",
+        (
+            "Top 5 services/projects contributing to spend.",
+            "Patterns by environment (prod, non-prod) and region.",
+            "Any anomalous spikes or waste patterns detected.",
+        ),
+    ),
+    (
+        "3. Recommended Optimization Levers",
+        (
+            "Rightsizing and decommissioning opportunities.",
+            "Commitment-based discounts (Savings Plans / CUDs / Reservations).",
+            "Storage and data transfer optimizations.",
+            "Governance and tagging improvements.",
+        ),
+    ),
+    (
+        "4. Impact & Timeline",
+        (
+            "Estimated monthly and annual savings (ranges).",
+            "Phased rollout plan (Phase 1, 2, 3).",
+            "Risks, dependencies, and owners.",
+        ),
+    ),
+    (
+        "5. Next Steps",
+        (
+            "Decision points required from leadership.",
+            "Initial actions for engineering / platform teams.",
+            "How success will be tracked and reported.",
+        ),
+    ),
+)
+
+
+# Cached tool results are kept as frozen, slotted records rather than dicts:
+# they are immutable, so cache hits need no defensive deep copy, and each tool
+# call builds exactly one fresh dict for ADK to serialize.
+@dataclass(frozen=True, slots=True)
+class _CostProfile:
+    """Aggregates computed from one billing CSV."""
+
+    row_count: int
+    total_cost: float
+    cost_column: str
+    cost_by_service: Tuple[Tuple[Any, float], ...]
+    cost_by_project: Tuple[Tuple[Any, float], ...]
+    detected_columns: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _SavingsEstimate:
+    """Result of estimate_savings_from_actions."""
+
+    baseline_monthly_cost: float
+    expected_reduction_percent: float
+    monthly_savings: float
+    projected_annual_savings: float
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "baseline_monthly_cost": self.baseline_monthly_cost,
+            "expected_reduction_percent": self.expected_reduction_percent,
+            "monthly_savings": self.monthly_savings,
+            "projected_annual_savings": self.projected_annual_savings,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _ScenarioComparison:
+    """Result of compare_two_cost_scenarios."""
+
+    baseline_cost: float
+    scenario_a_cost: float
+    scenario_b_cost: float
+    scenario_a_delta: float
+    scenario_b_delta: float
+    scenario_a_savings_percent: float
+    scenario_b_savings_percent: float
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "baseline_cost": self.baseline_cost,
+            "scenario_a_cost": self.scenario_a_cost,
+            "scenario_b_cost": self.scenario_b_cost,
+            "scenario_a_delta": self.scenario_a_delta,
+            "scenario_b_delta": self.scenario_b_delta,
+            "scenario_a_savings_percent": self.scenario_a_savings_percent,
+            "scenario_b_savings_percent": self.scenario_b_savings_percent,
+        }
+
+
+_profile_cache: "OrderedDict[str, _CostProfile]" = OrderedDict()
+_profile_cache_lock = threading.Lock()
+
+# Worker threads for load_and_profile_costs_async. pyarrow's reader and the
+# numba kernel release the GIL, so profiling overlaps with the event loop.
+_PROFILE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="optiscale-profile"
+)
+
 
 def load_and_profile_costs(
     csv_text: str,
@@ -39,76 +214,393 @@ def load_and_profile_costs(
     The agent should use this tool whenever the user pastes or uploads
     raw billing data and asks for analysis.
     """
-    if not csv_text.strip():
+    # Reject unusable payloads before touching the parser or the cache.
+    if len(csv_text) > MAX_CSV_CHARS:
+        raise ValueError(
+            f"CSV too large ({len(csv_text)} characters, limit {MAX_CSV_CHARS}). "
+            "Pre-aggregate the billing data before submitting it."
+        )
+    stripped = csv_text.strip()
+    if not stripped:
         raise ValueError("csv_text is empty. Provide billing CSV contents as text.")
+    if "\n" not in stripped and "\r" not in stripped:
+        raise ValueError("CSV has only a header row. Include at least one data row.")
 
-    df = pd.read_csv(io.StringIO(csv_text))
-    if df.empty:
-        raise ValueError("Parsed CSV is empty. Check the input format.")
+    profile = _cached_profile(csv_text)
+
+    notes = (
+        "Use this structured profile to explain top spend drivers, identify hotspots, "
+        "and propose concrete optimization levers. Always clearly state assumptions."
+    )
+
+    return {
+        "currency": currency,
+        "cloud_provider": cloud_provider,
+        "row_count": profile.row_count,
+        "total_cost": round(profile.total_cost, 2),
+        "cost_column": profile.cost_column,
+        "cost_by_service": dict(profile.cost_by_service),
+        "cost_by_project": dict(profile.cost_by_project),
+        "detected_columns": list(profile.detected_columns),
+        "notes": notes,
+    }
+
+
+@functools.wraps(load_and_profile_costs)
+async def load_and_profile_costs_async(
+    csv_text: str,
+    cloud_provider: str = "aws",
+    currency: str = "USD",
+) -> Dict[str, Any]:
+    # Registered with the agent in place of load_and_profile_costs: functools.wraps
+    # keeps the tool name and docstring the model sees, while the parse and
+    # aggregation run on _PROFILE_EXECUTOR instead of blocking the event loop.
+    return await asyncio.wrap_future(
+        _PROFILE_EXECUTOR.submit(
+            load_and_profile_costs, csv_text, cloud_provider, currency
+        )
+    )
+
+
+def _cached_profile(csv_text: str) -> _CostProfile:
+    """
+    Return the aggregated profile for ``csv_text``, memoized by content hash.
+
+    The cache is keyed on a BLAKE2 digest of the CSV so identical payloads skip
+    parsing entirely.
+    """
+    # Encode once; the bytes are both hashed and handed to the parser as-is.
+    data = csv_text.encode("utf-8")
+    key = hashlib.blake2b(data, digest_size=16).hexdigest()
 
-    # Normalize column names
-    df.columns = [c.strip().lower().replace(" ", "_") for c in df.columns]
+    with _profile_cache_lock:
+        profile = _profile_cache.get(key)
+        if profile is not None:
+            _profile_cache.move_to_end(key)
+            return profile
 
-    detected_columns = list(df.columns)
+    profile = None
+    if pacsv is not None:
+        try:
+            profile = _profile_costs_arrow(data)
+        except pa.ArrowInvalid:
+            # Ragged or over-long rows: pandas pads/trims these, so let it retry.
+            profile = None
+    if profile is None:
+        profile = _profile_costs_pandas(data)
 
-    # Find the first "cost" column
-    cost_cols = [c for c in df.columns if "cost" in c]
-    if not cost_cols:
+    with _profile_cache_lock:
+        _profile_cache[key] = profile
+        _profile_cache.move_to_end(key)
+        while len(_profile_cache) > PROFILE_CACHE_SIZE:
+            _profile_cache.popitem(last=False)
+    return profile
+
+
+def _clear_profile_cache() -> None:
+    """Drop every memoized CSV profile."""
+    with _profile_cache_lock:
+        _profile_cache.clear()
+
+
+load_and_profile_costs.cache_clear = _clear_profile_cache
+
+
+def _dedupe_columns(columns: Iterable[str]) -> List[str]:
+    """
+    Name blank and duplicate header cells the way ``pd.read_csv`` does.
+
+    Blank names become ``"Unnamed: <i>"`` and repeats get ``.1``, ``.2``, ...
+    suffixes, so both parse paths report identical column names.
+    """
+    names = [name or f"Unnamed: {i}" for i, name in enumerate(columns)]
+    counts: Dict[str, int] = {}
+    for i, name in enumerate(names):
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def _resolve_columns(columns: Iterable[str]) -> Tuple[List[str], int, int, int]:
+    """
+    Normalize raw CSV header names and locate the columns we aggregate over.
+
+    Returns ``(normalized, cost_idx, service_idx, project_idx)`` where each index
+    points at the first column whose name contains "cost", "service"/"product"
+    or "project"/"account" respectively (-1 when absent). The header is walked
+    once, which matters for wide exports with hundreds of tag columns.
+    """
+    normalized = []
+    cost_idx = svc_idx = prj_idx = -1
+    for i, column in enumerate(columns):
+        name = column.strip().lower().replace(" ", "_")
+        normalized.append(name)
+        if cost_idx < 0 and "cost" in name:
+            cost_idx = i
+        if svc_idx < 0 and ("service" in name or "product" in name):
+            svc_idx = i
+        if prj_idx < 0 and ("project" in name or "account" in name):
+            prj_idx = i
+
+    if cost_idx < 0:
         raise ValueError(
             "No cost column found. Expected a column containing 'cost' in its name."
         )
-    cost_col = cost_cols[0]
+    return normalized, cost_idx, svc_idx, prj_idx
 
-    # Convert cost to numeric
-    df[cost_col] = pd.to_numeric(df[cost_col], errors="coerce").fillna(0.0)
 
-    total_cost = float(df[cost_col].sum())
-    row_count = int(len(df))
+def _profile_costs_pandas(data: bytes) -> _CostProfile:
+    """
+    Aggregate the billing CSV with pandas (used when pyarrow is unavailable).
 
-    # Detect a service column
-    service_cols = [c for c in df.columns if "service" in c or "product" in c]
-    cost_by_service = {}
-    if service_cols:
-        svc_col = service_cols[0]
-        cost_by_service = (
-            df.groupby(svc_col)[cost_col]
-            .sum()
-            .sort_values(ascending=False)
-            .round(2)
-            .head(20)
-            .to_dict()
+    The header is read on its own first so that the full parse only handles
+    the cost, service and project columns, with the group columns parsed
+    straight into Categoricals.
+    """
+    # Read just the header
+    try:
+        raw_columns = list(pd.read_csv(io.BytesIO(data), nrows=0).columns)
+    except (pd.errors.ParserError, pd.errors.EmptyDataError) as exc:
+        raise ValueError(f"Could not parse CSV: {exc}. Check the input format.") from exc
+
+    # Normalize column names and detect the cost/service/project columns
+    detected_columns, cost_idx, svc_idx, prj_idx = _resolve_columns(raw_columns)
+    cost_col = detected_columns[cost_idx]
+    group_idx = {"service": svc_idx, "project": prj_idx}
+    group_idx = {name: idx for name, idx in group_idx.items() if idx >= 0}
+
+    try:
+        df = pd.read_csv(
+            io.BytesIO(data),
+            usecols=list(
+                dict.fromkeys(raw_columns[i] for i in (cost_idx, *group_idx.values()))
+            ),
+            # Categories are parsed as strings, matching the Arrow path's keys.
+            dtype={raw_columns[i]: "category" for i in group_idx.values()},
         )
+    except (pd.errors.ParserError, pd.errors.EmptyDataError) as exc:
+        raise ValueError(f"Could not parse CSV: {exc}. Check the input format.") from exc
+    if df.empty:
+        raise ValueError("Parsed CSV is empty. Check the input format.")
 
-    # Detect a project/account column
-    project_cols = [c for c in df.columns if "project" in c or "account" in c]
-    cost_by_project = {}
-    if project_cols:
-        prj_col = project_cols[0]
-        cost_by_project = (
-            df.groupby(prj_col)[cost_col]
-            .sum()
-            .sort_values(ascending=False)
-            .round(2)
-            .head(20)
-            .to_dict()
+    # Convert cost to numeric, filling unparseable values with 0 in place
+    costs = pd.to_numeric(df[raw_columns[cost_idx]], errors="coerce").to_numpy(
+        dtype=np.float64, copy=False
+    )
+    costs = np.nan_to_num(
+        costs, copy=not costs.flags.writeable, nan=0.0, posinf=np.inf, neginf=-np.inf
+    )
+
+    total_cost = float(costs.sum())
+    row_count = int(len(df))
+
+    # Aggregate by service and project/account, when present
+    group_keys = {
+        name: _category_codes(df[raw_columns[idx]]) for name, idx in group_idx.items()
+    }
+
+    breakdowns = _top_groups(group_keys, costs)
+
+    return _CostProfile(
+        row_count=row_count,
+        total_cost=total_cost,
+        cost_column=cost_col,
+        cost_by_service=breakdowns.get("service", ()),
+        cost_by_project=breakdowns.get("project", ()),
+        detected_columns=tuple(detected_columns),
+    )
+
+
+def _category_codes(column: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Return ``(codes, categories)`` for a group column; missing keys are coded -1.
+
+    The column is dictionary-encoded as a pandas Categorical unless it already
+    is one, so the aggregation works on small integer codes instead of hashing
+    a Python string per row.
+    """
+    if not isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype("category")
+    return column.cat.codes.to_numpy(), column.cat.categories
+
+
+def _top_groups(
+    factorized: Dict[str, Tuple[np.ndarray, Any]], costs: np.ndarray
+) -> Dict[str, Tuple[Tuple[Any, float], ...]]:
+    """
+    Sum ``costs`` per key for each ``(codes, uniques)`` pair in ``factorized``.
+
+    ``codes`` holds one integer code per row (-1 for a missing key) indexing
+    into ``uniques``. Only the TOP_N_GROUPS largest sums are selected
+    (``np.argpartition``) and sorted, instead of sorting every group. Each
+    breakdown is returned as ``(key, cost)`` pairs in descending cost order.
+    """
+    if numba is not None and len(factorized) == 2 and costs.size >= _NUMBA_MIN_ROWS:
+        (svc_codes, svc_uniques), (prj_codes, prj_uniques) = factorized.values()
+        all_sums = _fused_group_sum(
+            svc_codes,
+            prj_codes,
+            costs,
+            len(svc_uniques),
+            len(prj_uniques),
+            numba.get_num_threads(),
         )
+    else:
+        all_sums = []
+        for codes, uniques in factorized.values():
+            # Missing keys are coded -1; drop them like groupby does
+            valid = codes >= 0
+            all_sums.append(
+                np.bincount(codes[valid], weights=costs[valid], minlength=len(uniques))
+            )
+
+    breakdowns = {}
+    for (name, (_, uniques)), sums in zip(factorized.items(), all_sums):
+        k = min(TOP_N_GROUPS, sums.size)
+        if k == 0:
+            breakdowns[name] = ()
+            continue
+        top = np.argpartition(-sums, k - 1)[:k]
+        top = top[np.argsort(-sums[top], kind="stable")]
+        breakdowns[name] = tuple(
+            (key, round(value, 2))
+            for key, value in zip(uniques.take(top).tolist(), sums[top].tolist())
+        )
+    return breakdowns
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _fused_group_sum(svc_codes, prj_codes, values, n_svc, n_prj, n_chunks):
+        """
+        Sum ``values`` per service code and per project code in one pass.
+
+        Rows are split into ``n_chunks`` contiguous chunks, one per thread; each
+        accumulates into its own row of a local array and the rows are reduced
+        at the end, so no atomics are needed. Negative codes (missing keys) are
+        skipped.
+        """
+        chunk = (values.size + n_chunks - 1) // n_chunks
+        svc_local = np.zeros((n_chunks, n_svc))
+        prj_local = np.zeros((n_chunks, n_prj))
+        for t in numba.prange(n_chunks):
+            for i in range(t * chunk, min((t + 1) * chunk, values.size)):
+                if svc_codes[i] >= 0:
+                    svc_local[t, svc_codes[i]] += values[i]
+                if prj_codes[i] >= 0:
+                    prj_local[t, prj_codes[i]] += values[i]
+        return svc_local.sum(axis=0), prj_local.sum(axis=0)
+
+
+def _profile_costs_arrow(data: bytes) -> Optional[_CostProfile]:
+    """
+    Aggregate the billing CSV with pyarrow.
 
-    notes = (
-        "Use this structured profile to explain top spend drivers, identify hotspots, "
-        "and propose concrete optimization levers. Always clearly state assumptions."
+    The header is read on its own first so that the full parse only
+    materializes the cost, service and project columns. The group columns are
+    dictionary-encoded by the reader, so their indices feed ``_top_groups``
+    directly without a factorize step.
+
+    Returns None for headers this split cannot handle (a quoted cell spanning
+    lines, or "\r"-only line endings); the caller then falls back to pandas.
+    """
+    # Skip a BOM and leading blank lines, as pd.read_csv does.
+    header_start = len(codecs.BOM_UTF8) if data.startswith(codecs.BOM_UTF8) else 0
+    while header_start < len(data) and data[header_start] in b"\r\n":
+        header_start += 1
+
+    # Split off the header line ourselves: Arrow needs the whole header inside
+    # its first block, which fails for very wide exports.
+    header_end = data.find(b"\n", header_start)
+    if header_end < 0:
+        return None
+    header = data[header_start:header_end].decode("utf-8").rstrip("\r")
+    if header.count('"') % 2:
+        # An unbalanced quote means a header cell continues on the next line.
+        return None
+    raw_columns = _dedupe_columns(next(csv.reader([header])))
+    body = pa.py_buffer(data)[header_end + 1 :]
+
+    # Normalize column names and detect the cost/service/project columns
+    detected_columns, cost_idx, svc_idx, prj_idx = _resolve_columns(raw_columns)
+    cost_col = detected_columns[cost_idx]
+    group_idx = {"service": svc_idx, "project": prj_idx}
+    group_idx = {name: idx for name, idx in group_idx.items() if idx >= 0}
+
+    include_columns = list(
+        dict.fromkeys(raw_columns[i] for i in (cost_idx, *group_idx.values()))
     )
+    table = pacsv.read_csv(
+        pa.BufferReader(body),
+        read_options=pacsv.ReadOptions(
+            use_threads=True,
+            # Every row must fit in one block; size blocks off the header width.
+            block_size=max(_ARROW_BLOCK_SIZE, 4 * len(header)),
+            column_names=raw_columns,
+        ),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=include_columns,
+            column_types={
+                raw_columns[i]: pa.dictionary(pa.int32(), pa.string())
+                for i in group_idx.values()
+            },
+            # Match pandas: NA tokens are missing values, not strings.
+            null_values=list(_PANDAS_NA_VALUES),
+            strings_can_be_null=True,
+        ),
+    )
+    if table.num_rows == 0:
+        raise ValueError("Parsed CSV is empty. Check the input format.")
 
-    return {
-        "currency": currency,
-        "cloud_provider": cloud_provider,
-        "row_count": row_count,
-        "total_cost": round(total_cost, 2),
-        "cost_column": cost_col,
-        "cost_by_service": cost_by_service,
-        "cost_by_project": cost_by_project,
-        "detected_columns": detected_columns,
-        "notes": notes,
+    # Convert cost to numeric
+    costs = pc.fill_null(_arrow_to_float(table.column(raw_columns[cost_idx])), 0.0)
+
+    total_cost = float(pc.sum(costs, min_count=0).as_py())
+    row_count = int(table.num_rows)
+
+    # Aggregate by service and project/account, when present
+    group_keys = {
+        name: _arrow_dictionary_codes(table.column(raw_columns[idx]))
+        for name, idx in group_idx.items()
     }
+    breakdowns = _top_groups(group_keys, costs.to_numpy())
+
+    return _CostProfile(
+        row_count=row_count,
+        total_cost=total_cost,
+        cost_column=cost_col,
+        cost_by_service=breakdowns.get("service", ()),
+        cost_by_project=breakdowns.get("project", ()),
+        detected_columns=tuple(detected_columns),
+    )
+
+
+def _arrow_to_float(column: "pa.ChunkedArray") -> "pa.ChunkedArray":
+    """Cast an Arrow column to float64; unparseable values become null."""
+    if pa.types.is_dictionary(column.type):
+        column = column.cast(column.type.value_type)
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        return column.cast(pa.float64())
+    if pa.types.is_null(column.type):
+        return column.cast(pa.float64())
+    # Mixed or formatted values: mirror pd.to_numeric(errors="coerce").
+    coerced = pd.to_numeric(column.to_pandas(), errors="coerce")
+    return pa.chunked_array([pa.array(coerced, type=pa.float64(), from_pandas=True)])
+
+
+def _arrow_dictionary_codes(
+    column: "pa.ChunkedArray",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(codes, uniques)`` for a dictionary column; nulls are coded -1."""
+    combined = column.unify_dictionaries().combine_chunks()
+    codes = pc.fill_null(combined.indices, -1).to_numpy()
+    return codes, combined.dictionary.to_numpy(zero_copy_only=False)
 
 
 def estimate_savings_from_actions(
@@ -139,14 +631,83 @@ def estimate_savings_from_actions(
     if expected_reduction_percent < 0:
         raise ValueError("expected_reduction_percent cannot be negative.")
 
+    return _estimate_savings(
+        float(baseline_monthly_cost), float(expected_reduction_percent)
+    ).to_dict()
+
+
+@functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
+def _estimate_savings(
+    baseline_monthly_cost: float, expected_reduction_percent: float
+) -> _SavingsEstimate:
+    """Memoized body of estimate_savings_from_actions."""
     monthly_savings = baseline_monthly_cost * (expected_reduction_percent / 100.0)
     annual_savings = monthly_savings * 12.0
 
+    return _SavingsEstimate(
+        baseline_monthly_cost=round(baseline_monthly_cost, 2),
+        expected_reduction_percent=round(expected_reduction_percent, 2),
+        monthly_savings=round(monthly_savings, 2),
+        projected_annual_savings=round(annual_savings, 2),
+    )
+
+
+def estimate_savings_batch(
+    baseline_monthly_cost: float,
+    reduction_percents: List[float],
+) -> Dict[str, Any]:
+    """
+    Estimate savings for several reduction assumptions in a single call.
+
+    Args:
+        baseline_monthly_cost: Current monthly cloud spend (e.g. 15000.0).
+        reduction_percents: Expected % reductions to evaluate
+                            (e.g. [10.0, 20.0, 30.0]).
+
+    Returns:
+        {
+          "baseline_monthly_cost": float,
+          "estimates": [
+            {
+              "expected_reduction_percent": float,
+              "monthly_savings": float,
+              "projected_annual_savings": float
+            },
+            ...
+          ]
+        }
+
+    The agent should prefer this over repeated `estimate_savings_from_actions`
+    calls when presenting conservative / expected / aggressive ranges.
+    """
+    if baseline_monthly_cost < 0:
+        raise ValueError("baseline_monthly_cost cannot be negative.")
+    percents = np.asarray(reduction_percents, dtype=np.float64)
+    if (percents < 0).any():
+        raise ValueError("reduction_percents cannot contain negative values.")
+
+    if ne is not None and percents.size >= _NUMEXPR_MIN_SIZE:
+        local_dict = {"baseline": baseline_monthly_cost, "percents": percents}
+        monthly_savings = ne.evaluate("baseline * (percents / 100.0)", local_dict)
+        annual_savings = ne.evaluate(
+            "baseline * (percents / 100.0) * 12.0", local_dict
+        )
+    else:
+        monthly_savings = baseline_monthly_cost * (percents / 100.0)
+        annual_savings = monthly_savings * 12.0
+
     return {
         "baseline_monthly_cost": round(baseline_monthly_cost, 2),
-        "expected_reduction_percent": round(expected_reduction_percent, 2),
-        "monthly_savings": round(monthly_savings, 2),
-        "projected_annual_savings": round(annual_savings, 2),
+        "estimates": [
+            {
+                "expected_reduction_percent": round(pct, 2),
+                "monthly_savings": round(monthly, 2),
+                "projected_annual_savings": round(annual, 2),
+            }
+            for pct, monthly, annual in zip(
+                percents.tolist(), monthly_savings.tolist(), annual_savings.tolist()
+            )
+        ],
     }
 
 
@@ -179,25 +740,84 @@ def compare_two_cost_scenarios(
     if baseline_cost <= 0:
         raise ValueError("baseline_cost must be > 0 for meaningful comparison.")
 
-    def _calc(cost: float) -> Dict[str, float]:
+    return _compare_scenarios(
+        float(baseline_cost), float(scenario_a_cost), float(scenario_b_cost)
+    ).to_dict()
+
+
+@functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
+def _compare_scenarios(
+    baseline_cost: float, scenario_a_cost: float, scenario_b_cost: float
+) -> _ScenarioComparison:
+    """Memoized body of compare_two_cost_scenarios."""
+    def _calc(cost: float) -> Tuple[float, float]:
         delta = baseline_cost - cost
         pct = (delta / baseline_cost) * 100.0
-        return {
-            "delta": round(delta, 2),
-            "pct_savings": round(pct, 2),
+        return round(delta, 2), round(pct, 2)
+
+    a_delta, a_pct = _calc(scenario_a_cost)
+    b_delta, b_pct = _calc(scenario_b_cost)
+
+    return _ScenarioComparison(
+        baseline_cost=round(baseline_cost, 2),
+        scenario_a_cost=round(scenario_a_cost, 2),
+        scenario_b_cost=round(scenario_b_cost, 2),
+        scenario_a_delta=a_delta,
+        scenario_b_delta=b_delta,
+        scenario_a_savings_percent=a_pct,
+        scenario_b_savings_percent=b_pct,
+    )
+
+
+def compare_cost_scenarios(
+    baseline_cost: float,
+    scenario_costs: List[float],
+) -> Dict[str, Any]:
+    """
+    Compare baseline against any number of alternative cost scenarios.
+
+    Args:
+        baseline_cost: Cost of current state.
+        scenario_costs: Cost of each scenario to evaluate, in order.
+
+    Returns:
+        {
+          "baseline_cost": float,
+          "scenarios": [
+            {"cost": float, "delta": float, "savings_percent": float},
+            ...
+          ]
         }
 
-    a = _calc(scenario_a_cost)
-    b = _calc(scenario_b_cost)
+    The agent should prefer this over repeated `compare_two_cost_scenarios`
+    calls when weighing more than two plans.
+    """
+    if baseline_cost <= 0:
+        raise ValueError("baseline_cost must be > 0 for meaningful comparison.")
+
+    costs = np.asarray(scenario_costs, dtype=np.float64)
+    if ne is not None and costs.size >= _NUMEXPR_MIN_SIZE:
+        deltas = ne.evaluate(
+            "baseline - costs", {"baseline": baseline_cost, "costs": costs}
+        )
+        # Reuse deltas; the division and scaling run in one pass with no temporary.
+        pcts = ne.evaluate(
+            "deltas / baseline * 100.0", {"deltas": deltas, "baseline": baseline_cost}
+        )
+    else:
+        deltas = baseline_cost - costs
+        pcts = (deltas / baseline_cost) * 100.0
 
     return {
         "baseline_cost": round(baseline_cost, 2),
-        "scenario_a_cost": round(scenario_a_cost, 2),
-        "scenario_b_cost": round(scenario_b_cost, 2),
-        "scenario_a_delta": a["delta"],
-        "scenario_b_delta": b["delta"],
-        "scenario_a_savings_percent": a["pct_savings"],
-        "scenario_b_savings_percent": b["pct_savings"],
+        "scenarios": [
+            {
+                "cost": round(cost, 2),
+                "delta": round(delta, 2),
+                "savings_percent": round(pct, 2),
+            }
+            for cost, delta, pct in zip(costs.tolist(), deltas.tolist(), pcts.tolist())
+        ],
     }
 
 
@@ -222,54 +842,28 @@ def generate_exec_summary_outline(goal: str, audience: str = "cxo") -> Dict[str,
 
     The LLM should then expand this outline into full narrative text.
     """
-    title = "Cloud Cost Optimization – Executive Summary"
-    sections = [
-        {
-            "heading": "1. Context & Objectives",
-            "bullets": [
-                "Briefly describe current cloud cost baseline and growth trend.",
-                f"State the primary goal: {goal}",
-                "Clarify time horizon and acceptable risk/constraints.",
-            ],
-        },
-        {
-            "heading": "2. Key Cost Drivers",
-            "bullets": [
-                "Top 5 services/projects contributing to spend.",
-                "Patterns by environment (prod, non-prod) and region.",
-                "Any anomalous spikes or waste patterns detected.",
-            ],
-        },
-        {
-            "heading": "3. Recommended Optimization Levers",
-            "bullets": [
-                "Rightsizing and decommissioning opportunities.",
-                "Commitment-based discounts (Savings Plans / CUDs / Reservations).",
-                "Storage and data transfer optimizations.",
-                "Governance and tagging improvements.",
-            ],
-        },
-        {
-            "heading": "4. Impact & Timeline",
-            "bullets": [
-                "Estimated monthly and annual savings (ranges).",
-                "Phased rollout plan (Phase 1, 2, 3).",
-                "Risks, dependencies, and owners.",
-            ],
-        },
-        {
-            "heading": "5. Next Steps",
-            "bullets": [
-                "Decision points required from leadership.",
-                "Initial actions for engineering / platform teams.",
-                "How success will be tracked and reported.",
-            ],
-        },
-    ]
-
     return {
-        "title": title,
+        "title": _EXEC_SUMMARY_TITLE,
         "audience": audience,
         "goal": goal,
-        "sections": sections,
+        "sections": [
+            {"heading": heading, "bullets": list(bullets)}
+            for heading, bullets in _exec_summary_sections(goal)
+        ],
     }
+
+
+@functools.lru_cache(maxsize=_TOOL_CACHE_SIZE)
+def _exec_summary_sections(goal: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """
+    Return the outline sections with ``goal`` filled in.
+
+    Only sections with a _GOAL_SENTINEL bullet are rebuilt; every other one is
+    the shared tuple from _STATIC_SECTIONS.
+    """
+    return tuple(
+        (heading, tuple(b.replace(_GOAL_SENTINEL, goal) for b in bullets))
+        if any(_GOAL_SENTINEL in b for b in bullets)
+        else (heading, bullets)
+        for heading, bullets in _STATIC_SECTIONS
+    )
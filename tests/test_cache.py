@@ -0,0 +1,133 @@
+"""
+Unit tests for the session-scoped result cache.
+
+The runner test drives `root_agent` with a stub model, so it needs no network.
+"""
+
+import asyncio
+
+import pytest
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+from optiscale_agent import tools
+from optiscale_agent.agent import root_agent
+from optiscale_agent.cache import SessionCache, session_cache
+from optiscale_agent.config import APP_NAME, DEFAULT_SESSION_ID
+
+
+CSV_V1 = "service,cost\nEC2,10\nS3,5\n"
+CSV_V2 = "service,cost\nEC2,99\nS3,5\n"
+
+
+class _StubLlm(BaseLlm):
+    """Asks for a profile of the CSV named in the prompt, then echoes history."""
+
+    model: str = "stub"
+    calls: int = 0
+
+    async def generate_content_async(self, llm_request, stream=False):
+        self.calls += 1
+        last = llm_request.contents[-1]
+        if any(part.function_response for part in last.parts):
+            text = f"reply after {len(llm_request.contents)} contents"
+            part = types.Part(text=text)
+        else:
+            csv_text = CSV_V1 if "v1" in last.parts[0].text else CSV_V2
+            part = types.Part(
+                function_call=types.FunctionCall(
+                    name="load_and_profile_costs", args={"csv_text": csv_text}
+                )
+            )
+        yield LlmResponse(content=types.Content(role="model", parts=[part]))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches():
+    session_cache.clear()
+    tools.load_and_profile_costs.cache_clear()
+    yield
+    session_cache.clear()
+
+
+def test_session_cache_evicts_least_recently_used():
+    cache = SessionCache(maxsize=2)
+    cache.put((("app", "u1", "s1"), "tool", "a"), {"v": 1})
+    cache.put((("app", "u1", "s1"), "tool", "b"), {"v": 2})
+    assert cache.get((("app", "u1", "s1"), "tool", "a")) == {"v": 1}
+
+    cache.put((("app", "u1", "s1"), "tool", "c"), {"v": 3})
+    assert cache.get((("app", "u1", "s1"), "tool", "b")) is None
+    assert len(cache) == 2
+
+
+def test_session_cache_invalidates_one_session_only():
+    cache = SessionCache(maxsize=8)
+    cache.put((("app", "u1", "s1"), "tool", "a"), {"v": 1})
+    cache.put((("app", "u2", "s1"), "tool", "a"), {"v": 2})
+
+    cache.invalidate_session(("app", "u1", "s1"))
+    assert cache.get((("app", "u1", "s1"), "tool", "a")) is None
+    assert cache.get((("app", "u2", "s1"), "tool", "a")) == {"v": 2}
+
+
+def test_runner_caches_tool_results_per_user_session(monkeypatch):
+    profiled = []
+    real_profile = tools.load_and_profile_costs
+
+    def counting_profile(csv_text, *args, **kwargs):
+        profiled.append(csv_text)
+        return real_profile(csv_text, *args, **kwargs)
+
+    monkeypatch.setattr(tools, "load_and_profile_costs", counting_profile)
+
+    llm = _StubLlm()
+    session_service = InMemorySessionService()
+    runner = Runner(
+        agent=root_agent.model_copy(update={"model": llm}),
+        app_name=APP_NAME,
+        session_service=session_service,
+    )
+    # Both users deliberately share the default session id.
+    for user_id in ("alice", "bob"):
+        asyncio.run(
+            session_service.create_session(
+                app_name=APP_NAME, user_id=user_id, session_id=DEFAULT_SESSION_ID
+            )
+        )
+
+    def ask(user_id, text):
+        calls_before = llm.calls
+        events = runner.run(
+            user_id=user_id,
+            session_id=DEFAULT_SESSION_ID,
+            new_message=types.Content(role="user", parts=[types.Part(text=text)]),
+        )
+        replies = [e.content.parts[0].text for e in events if e.is_final_response()]
+        # The model is never served from the cache: one call for the tool
+        # request and one for the final reply, every turn.
+        assert llm.calls - calls_before == 2
+        return replies[-1]
+
+    first = ask("alice", "profile v1")
+    assert len(profiled) == 1
+
+    # Same question in the same session: tool hit, but the longer history
+    # still reaches the model and changes the reply.
+    assert ask("alice", "profile v1") != first
+    assert len(profiled) == 1
+
+    # Another user with the same session id does not see alice's entry.
+    ask("bob", "profile v1")
+    assert len(profiled) == 2
+
+    # A new CSV flushes alice's session only.
+    ask("alice", "profile v2")
+    assert profiled[-1] == CSV_V2
+    ask("bob", "profile v1")
+    assert len(profiled) == 3
+    ask("alice", "profile v1")
+    assert len(profiled) == 4
@@ -0,0 +1,214 @@
+"""
+Unit tests for the deterministic OptiScale tools.
+
+These run without a model or network access.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from optiscale_agent import tools
+
+
+BILLING_CSV = """Service Name,Project ID,Unblended Cost
+EC2,prod,100.0
+S3,prod,25.5
+EC2,dev,40.0
+RDS,,10.0
+,dev,5.0
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_profile_cache():
+    tools.load_and_profile_costs.cache_clear()
+    yield
+    tools.load_and_profile_costs.cache_clear()
+
+
+@pytest.fixture(params=["arrow", "pandas"])
+def backend(request, monkeypatch):
+    """Run a profiling test once per CSV backend."""
+    if request.param == "arrow" and tools.pacsv is None:
+        pytest.skip("pyarrow is not installed")
+    if request.param == "pandas":
+        monkeypatch.setattr(tools, "pacsv", None)
+    return request.param
+
+
+def _profile_both_backends(monkeypatch, csv_text):
+    """Profile ``csv_text`` with the default backend, then with pandas only."""
+    default = tools.load_and_profile_costs(csv_text)
+    tools.load_and_profile_costs.cache_clear()
+    monkeypatch.setattr(tools, "pacsv", None)
+    return default, tools.load_and_profile_costs(csv_text)
+
+
+def test_load_and_profile_costs_aggregates_by_service_and_project(backend):
+    profile = tools.load_and_profile_costs(BILLING_CSV, cloud_provider="aws")
+
+    assert profile["row_count"] == 5
+    assert profile["total_cost"] == 180.5
+    assert profile["cost_column"] == "unblended_cost"
+    assert profile["cost_by_service"] == {"EC2": 140.0, "S3": 25.5, "RDS": 10.0}
+    assert profile["cost_by_project"] == {"prod": 125.5, "dev": 45.0}
+    assert profile["detected_columns"] == ["service_name", "project_id", "unblended_cost"]
+
+
+def test_load_and_profile_costs_backends_agree(monkeypatch):
+    if tools.pacsv is None:
+        pytest.skip("pyarrow is not installed")
+    csv_text = BILLING_CSV + "None,prod,1.0\n<NA>,NULL,2.0\nNA,n/a,NA\n"
+    arrow, pandas = _profile_both_backends(monkeypatch, csv_text)
+    assert arrow["cost_by_service"] == {"EC2": 140.0, "S3": 25.5, "RDS": 10.0}
+    assert arrow == pandas
+    # Same ranking too, not just the same totals.
+    for breakdown in ("cost_by_service", "cost_by_project"):
+        assert list(arrow[breakdown].items()) == list(pandas[breakdown].items())
+
+
+def test_load_and_profile_costs_cache_returns_independent_copies(backend):
+    first = tools.load_and_profile_costs(BILLING_CSV)
+    first["cost_by_service"]["EC2"] = 0.0
+
+    second = tools.load_and_profile_costs(BILLING_CSV, currency="EUR")
+    assert second["cost_by_service"]["EC2"] == 140.0
+    assert second["currency"] == "EUR"
+
+
+def test_load_and_profile_costs_requires_cost_column(backend):
+    with pytest.raises(ValueError):
+        tools.load_and_profile_costs("service,project\nEC2,prod\n")
+
+
+def test_load_and_profile_costs_reads_header_wider_than_a_block(monkeypatch):
+    extra = ",".join(f"tag_{i:05d}_{'x' * 16}" for i in range(4000))
+    csv_text = f"service,cost,{extra}\nEC2,1.5,{'a,' * 3999}a\nS3,2.0,{'b,' * 3999}b\n"
+    assert csv_text.index("\n") > 1 << 16
+
+    default, fallback = _profile_both_backends(monkeypatch, csv_text)
+    assert default["cost_by_service"] == {"S3": 2.0, "EC2": 1.5}
+    assert default == fallback
+
+
+def test_load_and_profile_costs_dedupes_header_like_pandas(monkeypatch):
+    csv_text = "cost,service,cost,\n1.0,EC2,9.0,x\n2.0,S3,9.0,y\n"
+
+    default, fallback = _profile_both_backends(monkeypatch, csv_text)
+    assert default["detected_columns"] == ["cost", "service", "cost.1", "unnamed:_3"]
+    assert default["total_cost"] == 3.0
+    assert default == fallback
+
+
+def test_load_and_profile_costs_tolerates_ragged_rows(monkeypatch):
+    csv_text = "service,cost\nEC2,1.0\nS3\nRDS,2.0\n"
+
+    default, fallback = _profile_both_backends(monkeypatch, csv_text)
+    assert default["row_count"] == 3
+    assert default["cost_by_service"] == {"RDS": 2.0, "EC2": 1.0, "S3": 0.0}
+    assert default == fallback
+
+
+@pytest.mark.parametrize(
+    "csv_text",
+    [
+        "\nservice,cost\nEC2,1\nS3,2\n",
+        '"service\nname",cost\nEC2,1\nS3,2\n',
+    ],
+    ids=["leading-blank-line", "multiline-header-cell"],
+)
+def test_load_and_profile_costs_header_not_on_first_line(monkeypatch, csv_text):
+    default, fallback = _profile_both_backends(monkeypatch, csv_text)
+    assert default["cost_by_service"] == {"S3": 2.0, "EC2": 1.0}
+    assert default == fallback
+
+
+def test_load_and_profile_costs_service_cost_column_keys_are_strings(monkeypatch):
+    csv_text = "service_cost\n10\n20\n10\n"
+
+    default, fallback = _profile_both_backends(monkeypatch, csv_text)
+    assert default["cost_by_service"] == {"10": 20.0, "20": 20.0}
+    assert default == fallback
+
+
+def test_load_and_profile_costs_reports_unparseable_csv(backend):
+    with pytest.raises(ValueError, match="Could not parse CSV"):
+        tools.load_and_profile_costs('service,cost\n"EC2,1.0\n')
+
+
+def test_memoized_tools_return_independent_copies():
+    savings = tools.estimate_savings_from_actions(15000.0, 20.0)
+    savings["monthly_savings"] = 0.0
+    assert tools.estimate_savings_from_actions(15000.0, 20.0)["monthly_savings"] == 3000.0
+
+    outline = tools.generate_exec_summary_outline("Cut EC2 spend by 30%")
+    outline["sections"][0]["bullets"].clear()
+    again = tools.generate_exec_summary_outline("Cut EC2 spend by 30%")
+    assert "State the primary goal: Cut EC2 spend by 30%" in again["sections"][0]["bullets"]
+
+
+def test_load_and_profile_costs_rejects_header_only_and_oversized_csv(monkeypatch):
+    with pytest.raises(ValueError, match="only a header row"):
+        tools.load_and_profile_costs("service,cost\n")
+
+    monkeypatch.setattr(tools, "MAX_CSV_CHARS", 10)
+    with pytest.raises(ValueError, match="too large"):
+        tools.load_and_profile_costs(BILLING_CSV)
+
+
+def test_batch_tools_match_scalar_tools():
+    batch = tools.estimate_savings_batch(15000.0, [10.0, 20.0])
+    assert [e["monthly_savings"] for e in batch["estimates"]] == [1500.0, 3000.0]
+    assert batch["estimates"][1]["projected_annual_savings"] == (
+        tools.estimate_savings_from_actions(15000.0, 20.0)["projected_annual_savings"]
+    )
+
+    pair = tools.compare_two_cost_scenarios(1000.0, 800.0, 650.0)
+    scenarios = tools.compare_cost_scenarios(1000.0, [800.0, 650.0])["scenarios"]
+    assert [s["delta"] for s in scenarios] == [
+        pair["scenario_a_delta"],
+        pair["scenario_b_delta"],
+    ]
+    assert [s["savings_percent"] for s in scenarios] == [
+        pair["scenario_a_savings_percent"],
+        pair["scenario_b_savings_percent"],
+    ]
+
+
+def test_load_and_profile_costs_async_matches_sync(backend):
+    profile = asyncio.run(tools.load_and_profile_costs_async(BILLING_CSV))
+    assert profile == tools.load_and_profile_costs(BILLING_CSV)
+    assert tools.load_and_profile_costs_async.__name__ == "load_and_profile_costs"
+
+
+def test_numba_group_sums_match_bincount(monkeypatch):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    # Integer-valued costs keep both summation orders exact; -1 marks null keys.
+    factorized = {
+        "service": (rng.integers(-1, 30, 5000), pd.Index([f"svc-{i}" for i in range(30)])),
+        "project": (rng.integers(-1, 8, 5000), pd.Index([f"prj-{i}" for i in range(8)])),
+    }
+    costs = rng.integers(0, 1000, 5000).astype(np.float64)
+
+    monkeypatch.setattr(tools, "_NUMBA_MIN_ROWS", 0)
+    fused = tools._top_groups(factorized, costs)
+    monkeypatch.setattr(tools, "numba", None)
+    assert fused == tools._top_groups(factorized, costs)
+
+
+def test_numexpr_batch_tools_match_numpy(monkeypatch):
+    pytest.importorskip("numexpr")
+    rng = np.random.default_rng(0)
+    percents = (rng.random(2000) * 100.0).tolist()
+    costs = (rng.random(2000) * 20000.0).tolist()
+
+    monkeypatch.setattr(tools, "_NUMEXPR_MIN_SIZE", 0)
+    savings = tools.estimate_savings_batch(15000.0, percents)
+    scenarios = tools.compare_cost_scenarios(12345.67, costs)
+    monkeypatch.setattr(tools, "ne", None)
+    assert savings == tools.estimate_savings_batch(15000.0, percents)
+    assert scenarios == tools.compare_cost_scenarios(12345.67, costs)